@@ -9,8 +9,18 @@ Under normal circumstances, the main module creates one NEODatabase from the
 data on NEOs and close approaches extracted by `extract.load_neos` and
 `extract.load_approaches`.
 
+Alongside the `CloseApproach` objects themselves, the database stores each
+attribute that can be filtered on as a column: a flat list parallel to the
+approaches. Queries scan these columns rather than the objects. The approaches
+are kept sorted by time, so date criteria are resolved by binary search.
+
 You'll edit this file in Tasks 2 and 3.
 """
+import bisect
+import itertools
+import operator
+
+from filters import AttributeFilter
 
 
 class NEODatabase:
@@ -28,22 +38,47 @@ class NEODatabase:
         :param neos: A collection of `NearEarthObject`s.
         :param approaches: A collection of `CloseApproach`es.
         """
-        self._neos = neos
-        self._approaches = approaches
+        self._neos = list(neos)
+
+        # Keep the close approaches sorted by time, so that date criteria can be
+        # resolved with a binary search.
+        self._approaches = list(approaches)
+        try:
+            self._approaches.sort(key=operator.attrgetter("time"))
+        except TypeError:
+            # Some close approach has an unknown time, so the approaches can't be fully
+            # sorted; date filters then fall back to scanning the date column.
+            pass
 
         # Create a dictionary mapping the primary designation to its NearEarthObject
-        self._neo_designations = {neo.designation: neo for neo in neos}
+        self._neo_designations = {neo.designation: neo for neo in self._neos}
 
-        # Create a dictionary mapping the name to its NearEarthObject
-        self._neo_names = {neo.name: neo for neo in neos if neo.name}
+        # A dictionary mapping the name to its NearEarthObject, built on first use since
+        # many runs never look an NEO up by name.
+        self._neo_names = None
 
-        # Link together the NEOs and their close approaches
+        # Link together the NEOs and their close approaches in a single pass. Grouping
+        # the approaches by designation first was measured to be slower, since it
+        # costs an extra pass over every approach.
+        get_neo = self._neo_designations.get
         for approach in self._approaches:
-            neo = self._neo_designations.get(approach._designation)
-            if neo:
+            neo = get_neo(approach._designation)
+            if neo is not None:
                 approach.neo = neo
                 neo.approaches.append(approach)
 
+        # Store the filterable attributes of the close approaches column-wise, in
+        # the same order as `self._approaches`.
+        linked_neos = list(map(operator.attrgetter("neo"), self._approaches))
+        self._columns = {
+            "date": [approach.time.date() if approach.time else None for approach in self._approaches],
+            "distance": list(map(operator.attrgetter("distance"), self._approaches)),
+            "velocity": list(map(operator.attrgetter("velocity"), self._approaches)),
+            "diameter": [neo.diameter if neo is not None else float("nan") for neo in linked_neos],
+            "hazardous": [neo.hazardous if neo is not None else None for neo in linked_neos],
+        }
+        self._dates_sorted = None not in self._columns["date"]
+
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
 
@@ -62,8 +97,34 @@ class NEODatabase:
         :param name: The name, as a string, of the NEO to search for.
         :return: The `NearEarthObject` with the desired name, or `None`.
         """
+        if self._neo_names is None:
+            self._neo_names = {neo.name: neo for neo in self._neos if neo.name}
         return self._neo_names.get(name)
 
+    def _date_range(self, filters):
+        """Narrow the rows of the database by the date filters among a collection of filters.
+
+        Filters on the date column that test for equality or an inclusive bound
+        are resolved by binary search over the sorted dates, and consumed.
+
+        :param filters: A collection of filters capturing user-specified criteria.
+        :return: The half-open range `[lo, hi)` of candidate rows, and a list of the unconsumed filters.
+        """
+        lo, hi = 0, len(self._approaches)
+        remaining = []
+        dates = self._columns["date"]
+        for f in filters:
+            op = getattr(f, "op", None)
+            if not (self._dates_sorted and getattr(f, "attribute", None) == "date"
+                    and op in (operator.eq, operator.ge, operator.le)):
+                remaining.append(f)
+                continue
+            if op is not operator.le:
+                lo = bisect.bisect_left(dates, f.value, lo, hi)
+            if op is not operator.ge:
+                hi = bisect.bisect_right(dates, f.value, lo, hi)
+        return lo, hi, remaining
+
     def query(self, filters=()):
         """Query close approaches to generate those that match a collection of filters.
 
@@ -72,12 +133,31 @@ class NEODatabase:
 
         If no arguments are provided, generate all known close approaches.
 
-        The `CloseApproach` objects are generated in internal order, which isn't
-        guaranteed to be sorted meaningfully, although is often sorted by time.
+        The `CloseApproach` objects are generated in order of approach time, as
+        long as every close approach in the database has a known time.
+
+        Filters that name one of the database's columns in their `attribute` are
+        evaluated over that column; any other filter is called on each approach.
+        Each filter only sees the rows that passed the filters before it. Date
+        filters are applied first by narrowing the range of rows to scan, and the
+        rest are applied in order of their `cost`.
 
         :param filters: A collection of filters capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
-        for approach in self._approaches:
-            if all(f(approach) for f in filters):
-                yield approach
+        lo, hi, filters = self._date_range(filters)
+
+        # Apply the cheapest filters first, so that the costlier ones see fewer rows. Filters
+        # without a `cost` (e.g. plain callables) are called on whole objects, so go last.
+        filters = sorted(filters, key=lambda f: getattr(f, "cost", AttributeFilter.cost))
+
+        rows = range(lo, hi)
+        for f in filters:
+            column = self._columns.get(getattr(f, "attribute", None))
+            rows, candidates = itertools.tee(rows)
+            if column is None:
+                matches = map(f, map(self._approaches.__getitem__, candidates))
+            else:
+                matches = f.compare(map(column.__getitem__, candidates))
+            rows = itertools.compress(rows, matches)
+        yield from map(self._approaches.__getitem__, rows)
@@ -7,63 +7,243 @@ The `load_approaches` function extracts close approach data from a JSON file,
 formatted as described in the project instructions, into a collection of
 `CloseApproach` objects.
 
+Both functions can optionally (with `use_cache=True`) keep a pickled copy of
+their result in a sidecar file next to the source data (e.g. `neos.csv.pkl`),
+and reuse it on later runs for as long as neither the source file nor the code
+that parses it has changed. Unpickling runs arbitrary code, so only enable the
+cache for data files in directories you trust.
+
 The main module calls these functions with the arguments provided at the command
 line, and uses the resulting collections to build an `NEODatabase`.
 
 You'll edit this file in Task 2.
 """
+import contextlib
 import csv
+import gc
+import hashlib
 import json
+import marshal
+import operator
+import os
+import pickle
+import stat
+import sys
 
+from helpers import cd_to_datetime
 from models import NearEarthObject, CloseApproach
 
-import csv
-import json
+# The columns of the NEO CSV file used to build a `NearEarthObject`.
+NEO_FIELDS = ("pdes", "name", "diameter", "pha")
+
+# Projects a row of the CAD JSON file onto the fields used to build a `CloseApproach`
+# ("des", "cd", "dist" and "v_rel"), and the number of fields a row needs to have them all.
+CAD_FIELDS = operator.itemgetter(0, 3, 4, 7)
+CAD_WIDTH = 8
+
+# The suffix appended to a data file's path to name its pickled sidecar cache.
+CACHE_SUFFIX = ".pkl"
+
+
+@contextlib.contextmanager
+def _paused_gc():
+    """Pause the cyclic garbage collector for the duration of a `with` block.
+
+    Loading allocates hundreds of thousands of (acyclic) objects, each batch of
+    which would otherwise trigger another traversal of everything loaded so far.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _code_digest(parser):
+    """Digest the code that determines what a parser produces.
+
+    This covers the parser's own bytecode and the source files of its module
+    and of the `models` and `helpers` modules, so that editing any of them
+    invalidates the caches that the parser's output was pickled into.
+
+    :param parser: A function that parses a data file at a path into a collection.
+    :return: A hex digest, or `None` if some of that code can't be read.
+    """
+    digest = hashlib.sha256(marshal.dumps(parser.__code__))
+    for name in dict.fromkeys((parser.__module__, "models", "helpers")):
+        try:
+            with open(sys.modules[name].__file__, "rb") as infile:
+                digest.update(infile.read())
+        except (KeyError, AttributeError, TypeError, OSError):
+            return None
+    return digest.hexdigest()
+
+
+def _is_trusted_cache(cache_stat, data_stat):
+    """Decide whether a cache file may be unpickled alongside its data file.
+
+    The cache must be owned by the data file's owner, and must not be writable
+    by a group or by others unless the data file is too.
+
+    :param cache_stat: The `os.stat_result` of the cache file.
+    :param data_stat: The `os.stat_result` of the data file.
+    :return: Whether the cache file is trusted as much as the data file.
+    """
+    if cache_stat.st_uid != data_stat.st_uid:
+        return False
+    return not cache_stat.st_mode & ~data_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
 
 
-def load_neos(neo_csv_path):
+def _cached_load(path, parser, use_cache):
+    """Load a collection of objects from a data file, optionally through a pickled sidecar cache.
+
+    The cache records the size and modification time of the data file it was
+    built from and a digest of the code that parsed it, and is only reused
+    while all of them still match and the cache is owned like the data file.
+    Otherwise, the file is parsed with `parser` and the cache is rewritten. A
+    cache that can't be read or written is silently ignored.
+
+    :param path: A path to the data file.
+    :param parser: A function that parses the data file at a path into a collection.
+    :param use_cache: Whether to read and write the sidecar cache at all.
+    :return: The collection produced by `parser` for the data file.
+    """
+    digest = _code_digest(parser) if use_cache else None
+    if digest is None:
+        with _paused_gc():
+            return parser(path)
+
+    cache_path = f"{os.fspath(path)}{CACHE_SUFFIX}"
+    data_stat = os.stat(path)
+    key = (digest, data_stat.st_size, data_stat.st_mtime_ns)
+
+    with _paused_gc():
+        try:
+            # The key is pickled as its own first record, so that a stale cache is
+            # rejected without unpickling its (large) collection of objects.
+            with open(cache_path, "rb") as infile:
+                if _is_trusted_cache(os.fstat(infile.fileno()), data_stat) and pickle.load(infile) == key:
+                    return pickle.load(infile)
+        except (OSError, EOFError, ImportError, pickle.UnpicklingError,
+                AttributeError, TypeError, ValueError):
+            pass
+
+        objects = parser(path)
+
+    # Write to a temporary file first so that a concurrent reader never sees a partial cache.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as outfile:
+            pickle.dump(key, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(objects, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return objects
+
+
+def load_neos(neo_csv_path, use_cache=False):
     """Read near-Earth object information from a CSV file.
 
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
+    :param use_cache: Whether to reuse (or create) a pickled sidecar cache of the result.
     :return: A collection of `NearEarthObject`s.
     """
+    return _cached_load(neo_csv_path, _parse_neos, use_cache)
+
+
+def _parse_neos(neo_csv_path):
+    """Parse near-Earth object information from a CSV file, bypassing the cache."""
     neos = []
+    # A plain buffered text stream feeds the C csv reader fastest here; memory
+    # mapping the file and decoding it in one piece was measured to be slower.
     with open(neo_csv_path, "r") as infile:
-        reader = csv.DictReader(infile)
+        reader = csv.reader(infile)
+        header = next(reader, None)
+        if header is None:
+            return neos
+
+        # Project each row onto the columns of interest by position, rather than
+        # building a dictionary of all ~75 columns for every row.
+        try:
+            columns = operator.itemgetter(*(header.index(field) for field in NEO_FIELDS))
+        except ValueError as err:
+            print(f"Error reading NEO CSV header: {err}")
+            return neos
+
+        # Skip rows without a primary designation (or too short to have one) or
+        # with an unparseable diameter, and report them all at once rather than
+        # row by row.
+        width = max(header.index(field) for field in NEO_FIELDS) + 1
+        skipped = 0
         for row in reader:
+            designation, name, diameter, pha = columns(row) if len(row) >= width else ("",) * 4
+            if not designation:
+                skipped += 1
+                continue
             try:
-                neo = NearEarthObject(
-                    designation=row["pdes"],
-                    name=row["name"] or None,
-                    diameter=float(row["diameter"]) if row["diameter"] else None,
-                    hazardous=False if row["pha"] in ["", "N"] else True,
-                )
-                neos.append(neo)
-            except (KeyError, ValueError) as err:
-                print(f"Error creating NearEarthObject: {err}")
+                diameter = float(diameter) if diameter else None
+            except ValueError:
+                skipped += 1
+                continue
+            neos.append(NearEarthObject(
+                designation=sys.intern(designation),
+                name=name or None,
+                diameter=diameter,
+                hazardous=pha == "Y",
+            ))
+
+    if skipped:
+        print(f"Skipped {skipped} malformed rows of near-Earth object data in {neo_csv_path}")
     return neos
 
 
-def load_approaches(cad_json_path):
+def load_approaches(cad_json_path, use_cache=False):
     """Read close approach data from a JSON file.
 
     :param neo_csv_path: A path to a JSON file containing data about close approaches.
+    :param use_cache: Whether to reuse (or create) a pickled sidecar cache of the result.
     :return: A collection of `CloseApproach`es.
 
     fields are as per JSON file ["des", "orbit_id", "jd", "cd", "dist", "dist_min", "dist_max", "v_rel", "v_inf", "t_sigma_f", "h"]
     """
+    return _cached_load(cad_json_path, _parse_approaches, use_cache)
+
+
+def _parse_approaches(cad_json_path):
+    """Parse close approach data from a JSON file, bypassing the cache."""
     approaches = []
     with open(cad_json_path, "r") as infile:
-        data = json.load(infile)
-        for row in data["data"]:
-            try:
-                approach = CloseApproach(
-                    designation=row[0],
-                    time=row[3],
-                    distance=float(row[4]),
-                    velocity=float(row[7]),
-                )
-                approaches.append(approach)
-            except (IndexError, ValueError) as err:
-                print(f"Error creating CloseApproach: {err}")
+        rows = json.load(infile)["data"]
+
+    # Release each raw row as soon as it has been consumed, so that the parsed
+    # JSON and the `CloseApproach`es built from it are never both fully alive.
+    # Rows missing any field of interest, or with a field that can't be parsed,
+    # are skipped, and reported all at once.
+    skipped = 0
+    for i, row in enumerate(rows):
+        rows[i] = None
+        designation, cd, distance, velocity = CAD_FIELDS(row) if len(row) >= CAD_WIDTH else (None,) * 4
+        if not (designation and cd and distance and velocity):
+            skipped += 1
+            continue
+        try:
+            time, distance, velocity = cd_to_datetime(cd), float(distance), float(velocity)
+        except (TypeError, ValueError):
+            skipped += 1
+            continue
+        approaches.append(CloseApproach(
+            designation=sys.intern(designation),
+            time=time,
+            distance=distance,
+            velocity=velocity,
+        ))
+
+    if skipped:
+        print(f"Skipped {skipped} malformed rows of close approach data in {cad_json_path}")
     return approaches
@@ -9,7 +9,10 @@ This function can be thought to return a collection of instances of subclasses
 of `AttributeFilter` - a 1-argument callable (on a `CloseApproach`) constructed
 from a comparator (from the `operator` module), a reference value, and a class
 method `get` that subclasses can override to fetch an attribute of interest from
-the supplied `CloseApproach`.
+the supplied `CloseApproach`. Each subclass also names the `attribute` it
+fetches, which lets the `NEODatabase` evaluate the filter over a whole column
+of values at once with `compare`, instead of calling it on every approach, and
+gives a relative `cost` that the `NEODatabase` uses to order the filters.
 
 The `limit` function simply limits the maximum number of values produced by an
 iterator.
@@ -17,7 +20,7 @@ iterator.
 You'll edit this file in Tasks 3a and 3c.
 """
 import operator
-from itertools import islice
+from itertools import islice, repeat
 
 
 class UnsupportedCriterionError(NotImplementedError):
@@ -37,9 +40,19 @@ class AttributeFilter:
     infix notation).
 
     Concrete subclasses can override the `get` classmethod to provide custom
-    behavior to fetch a desired attribute from the given `CloseApproach`.
+    behavior to fetch a desired attribute from the given `CloseApproach`, and
+    set `attribute` to the name of the `NEODatabase` column holding the values
+    that `get` would return. Filters on the attached NEO see an approach with
+    no linked NEO as that column does: with a `nan` diameter and a `None`
+    hazardous status, rather than raising.
     """
 
+    # The name of the `NEODatabase` column that holds this filter's attribute.
+    attribute = None
+
+    # The relative cost of evaluating this filter; cheaper filters are applied first.
+    cost = 10
+
     def __init__(self, op, value):
         """Construct a new `AttributeFilter` from an binary predicate and a reference value.
 
@@ -70,6 +83,14 @@ class AttributeFilter:
         """
         raise UnsupportedCriterionError
 
+    def compare(self, values):
+        """Evaluate this filter over a stream of attribute values at once.
+
+        :param values: A stream of values, each as would be returned by `get`.
+        :return: A stream of whether each value satisfies this filter.
+        """
+        return map(self.op, values, repeat(self.value))
+
     def __repr__(self):
         """Return a computer-readable string representation of this object."""
         return f"{self.__class__.__name__}(op=operator.{self.op.__name__}, value={self.value})"
@@ -84,6 +105,9 @@ class DateFilter(AttributeFilter):
     The `get` class method retrieves the approach date from a given CloseApproach object.
     """
 
+    attribute = "date"
+    cost = 1
+
     @classmethod
     def get(cls, approach):
         """Get the approach date from a CloseApproach object.
@@ -103,6 +127,9 @@ class DistanceFilter(AttributeFilter):
     The `get` class method retrieves the approach distance from a given CloseApproach object.
     """
 
+    attribute = "distance"
+    cost = 2
+
     @classmethod
     def get(cls, approach):
         """Get the approach distance from a CloseApproach object.
@@ -122,6 +149,9 @@ class VelocityFilter(AttributeFilter):
     The `get` class method retrieves the approach velocity from a given CloseApproach object.
     """
 
+    attribute = "velocity"
+    cost = 2
+
     @classmethod
     def get(cls, approach):
         """Get the approach velocity from a CloseApproach object.
@@ -141,14 +171,17 @@ class DiameterFilter(AttributeFilter):
     The `get` class method retrieves the diameter of the NEO associated with a given CloseApproach object.
     """
 
+    attribute = "diameter"
+    cost = 3
+
     @classmethod
     def get(cls, approach):
         """Get the diameter of the NEO associated with a CloseApproach object.
 
         :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The diameter of the NEO associated with the given `CloseApproach`.
+        :return: The diameter of the NEO associated with the given `CloseApproach`, or `nan` if it has none.
         """
-        return approach.neo.diameter
+        return approach.neo.diameter if approach.neo is not None else float("nan")
 
 
 class HazardousFilter(AttributeFilter):
@@ -160,14 +193,17 @@ class HazardousFilter(AttributeFilter):
     The `get` class method retrieves the hazardous status of the NEO associated with a given CloseApproach object.
     """
 
+    attribute = "hazardous"
+    cost = 0
+
     @classmethod
     def get(cls, approach):
         """Get the hazardous status of the NEO associated with a CloseApproach object.
 
         :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The hazardous status of the NEO associated with the given `CloseApproach`.
+        :return: The hazardous status of the NEO associated with the given `CloseApproach`, or `None` if it has none.
         """
-        return approach.neo.hazardous
+        return approach.neo.hazardous if approach.neo is not None else None
 
 
 def create_filters(
@@ -12,6 +12,12 @@ provide that level of resolution, so the output format also will not.
 """
 import datetime
 
+# The English abbreviated month names used in the `cd` field, mapped to month numbers.
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
 
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
@@ -23,9 +29,26 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    Since NASA's dates are fixed-width, their fields are sliced out directly,
+    which is several times faster than `strptime`. Anything that doesn't fit
+    that layout exactly (separators in place, digits in every numeric field)
+    is still parsed with `strptime`.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
+    if (len(calendar_date) == 17
+            and calendar_date[4] == calendar_date[8] == "-"
+            and calendar_date[11] == " " and calendar_date[14] == ":"):
+        year, day = calendar_date[0:4], calendar_date[9:11]
+        hour, minute = calendar_date[12:14], calendar_date[15:17]
+        if year.isdigit() and day.isdigit() and hour.isdigit() and minute.isdigit():
+            try:
+                return datetime.datetime(
+                    int(year), _MONTHS[calendar_date[5:8]], int(day), int(hour), int(minute)
+                )
+            except (KeyError, ValueError):
+                pass
     return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
@@ -89,6 +89,9 @@ def make_parser():
     parser.add_argument('--cadfile', default=(DATA_ROOT / 'cad.json'),
                         type=pathlib.Path,
                         help="Path to JSON file of close approach data.")
+    parser.add_argument('--cache', action='store_true',
+                        help="Reuse (or create) a pickled copy of each data file's parsed "
+                             "contents next to it. Only use with data files you trust.")
     subparsers = parser.add_subparsers(dest='cmd')
 
     # Add the `inspect` subcommand parser.
@@ -383,7 +386,8 @@ def main():
     args = parser.parse_args()
 
     # Extract data from the data files into structured Python objects.
-    database = NEODatabase(load_neos(args.neofile), load_approaches(args.cadfile))
+    database = NEODatabase(load_neos(args.neofile, use_cache=args.cache),
+                           load_approaches(args.cadfile, use_cache=args.cache))
 
     # Run the chosen subcommand.
     if args.cmd == 'inspect':
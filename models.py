@@ -19,7 +19,6 @@ You'll edit this file in TASK-1.
 """
 from helpers import cd_to_datetime, datetime_to_str
 import math
-import datetime
 
 
 class NearEarthObject:
@@ -37,6 +36,7 @@ class NearEarthObject:
         diameter (float): The diameter of the NEO in kilometers (default: float('nan')).
         hazardous (bool): Whether the NEO is potentially hazardous to Earth.
         approaches (list): A collection of close approaches of the NEO (default: empty list).
+        fullname (str): The designation of the NEO, followed by its name in parentheses if it has one.
 
     Methods:
         __init__(self, designation, name=None, diameter=float('nan'), hazardous=False):
@@ -47,6 +47,9 @@ class NearEarthObject:
     `CloseApproach` objects in the `NEODatabase` constructor or through other means.
     """
 
+    # Many thousands of these are created, so skip the per-instance `__dict__`.
+    __slots__ = ("designation", "name", "diameter", "hazardous", "approaches", "fullname")
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
@@ -59,14 +62,12 @@ class NearEarthObject:
             self.diameter = float("nan")
         self.hazardous = info.get("hazardous")
 
+        # A full name representation of this NEO, built once since it is printed often.
+        self.fullname = f"{self.designation} ({self.name})" if self.name else f"{self.designation}"
+
         # Create an empty initial collection of linked approaches.
         self.approaches = []
 
-    @property
-    def fullname(self):
-        """Return a full name representation of this NEO."""
-        return f"{self.designation} ({self.name})" if self.name else f"{self.designation}"
-
     def __str__(self):
         """Return `str(self)`."""
         hazardous_status = "is" if self.hazardous else "is not"
@@ -123,6 +124,9 @@ class CloseApproach:
     the actual `NearEarthObject` instance in the `NEODatabase` constructor.
     """
 
+    # Hundreds of thousands of these are created, so skip the per-instance `__dict__`.
+    __slots__ = ("_designation", "time", "distance", "velocity", "neo", "_time_str")
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
@@ -130,15 +134,13 @@ class CloseApproach:
         """
         self._designation = info.get("designation")
         self.time = info.get("time")
-        if self.time:
+        if isinstance(self.time, str):
             self.time = cd_to_datetime(self.time)
-            assert isinstance(self.time, datetime.datetime), "Date must be a datetime object"
+        # The distance and velocity are expected to be floats already; `load_approaches`
+        # converts them while parsing, rather than every instance checking them here.
         self.distance = info.get("distance", float("nan"))
         self.velocity = info.get("velocity", float("nan"))
 
-        assert isinstance(self.distance, float), "Distance must be a float object"
-        assert isinstance(self.velocity, float), "Velocity must be a float object"
-
         # Create an attribute for the referenced NEO, originally None.
         self.neo = info.get("neo")
 
@@ -153,10 +155,15 @@ class CloseApproach:
 
     @property
     def time_str(self):
-        """Returns a formatted string representation of the approach time."""
-        if self.time:
-            return datetime_to_str(self.time)
-        return "an unknown time"
+        """Returns a formatted string representation of the approach time.
+
+        The string is formatted on first access and remembered afterwards.
+        """
+        try:
+            return self._time_str
+        except AttributeError:
+            self._time_str = datetime_to_str(self.time) if self.time else "an unknown time"
+            return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
@@ -175,7 +182,7 @@ class CloseApproach:
             [dict]: Keys associated with self attributes.
         """
         return {
-            "datetime_utc": datetime_to_str(self.time),
+            "datetime_utc": self.time_str,
             "distance_au": self.distance,
             "velocity_km_s": self.velocity,
         }
@@ -10,6 +10,7 @@ To run these tests from the project root, run:
 
 These tests should pass when Task 2 is complete.
 """
+import operator
 import pathlib
 import math
 import unittest
@@ -17,6 +18,8 @@ import unittest
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
+from filters import DiameterFilter, HazardousFilter
+from models import NearEarthObject, CloseApproach
 
 
 # Paths to the test data files.
@@ -115,5 +118,28 @@ class TestDatabase(unittest.TestCase):
         self.assertIsNone(nonexistent)
 
 
+class TestDatabaseWithIncompleteData(unittest.TestCase):
+    def test_iterator_of_approaches_with_an_unknown_time_is_kept(self):
+        neos = [NearEarthObject(designation='2101', name='Adonis')]
+        approaches = [
+            CloseApproach(designation='2101', time='2020-Jan-01 00:00', distance=0.1, velocity=10.0),
+            CloseApproach(designation='2101', time=None, distance=0.2, velocity=20.0),
+        ]
+        db = NEODatabase(neos, iter(approaches))
+        self.assertEqual(set(db.query()), set(approaches))
+        self.assertEqual(set(neos[0].approaches), set(approaches))
+
+    def test_filters_on_an_approach_without_a_neo_match_its_columns(self):
+        approach = CloseApproach(designation='433', time='2020-Jan-01 00:00', distance=0.1, velocity=10.0)
+        db = NEODatabase([], [approach])
+        self.assertIsNone(approach.neo)
+        self.assertTrue(math.isnan(DiameterFilter.get(approach)))
+        self.assertIsNone(HazardousFilter.get(approach))
+
+        for f in (DiameterFilter(operator.le, 1.0), HazardousFilter(operator.eq, False)):
+            self.assertFalse(f(approach))
+            self.assertEqual(list(db.query([f])), [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,12 +11,19 @@ To run these tests from the project root, run:
 These tests should pass when Task 2 is complete.
 """
 import collections.abc
+import contextlib
 import datetime
+import io
+import json
 import pathlib
 import math
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
-from extract import load_neos, load_approaches
+from extract import load_neos, load_approaches, CACHE_SUFFIX, _cached_load
 from models import NearEarthObject, CloseApproach
 
 
@@ -118,5 +125,147 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TempDirTestCase(unittest.TestCase):
+    """A test case that writes its data files into a fresh temporary directory, `self.root`."""
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+
+class TestLoadWrittenFiles(TempDirTestCase):
+    def test_columns_are_found_by_header_name(self):
+        neo_file = self.root / 'neos.csv'
+        with open(neo_file, 'w') as outfile:
+            outfile.write('pha,extra,diameter,name,pdes\n')
+            outfile.write('Y,x,0.6,Adonis,2101\n')
+            outfile.write('N,,,,2019 SC8\n')
+        neos = load_neos(neo_file)
+        self.assertEqual(len(neos), 2)
+
+        adonis, sc8 = neos
+        self.assertEqual(adonis.designation, '2101')
+        self.assertEqual(adonis.name, 'Adonis')
+        self.assertEqual(adonis.diameter, 0.6)
+        self.assertEqual(adonis.hazardous, True)
+
+        self.assertEqual(sc8.designation, '2019 SC8')
+        self.assertEqual(sc8.name, None)
+        self.assertTrue(math.isnan(sc8.diameter))
+        self.assertEqual(sc8.hazardous, False)
+
+    def test_neo_rows_without_designation_are_skipped_and_reported(self):
+        neo_file = self.root / 'neos.csv'
+        with open(neo_file, 'w') as outfile:
+            outfile.write('pdes,name,diameter,pha\n')
+            outfile.write('2101,Adonis,0.6,Y\n')
+            outfile.write(',Nameless,,N\n')
+            outfile.write('433\n')
+            outfile.write('1,A,abc,Y\n')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            neos = load_neos(neo_file)
+        self.assertEqual([neo.designation for neo in neos], ['2101'])
+        self.assertIn('Skipped 3 malformed rows', output.getvalue())
+
+    def test_approach_rows_missing_fields_are_skipped_and_reported(self):
+        cad_file = self.root / 'cad.json'
+        row = ['2101', '1', '2458849.5', '2020-Jan-01 00:00', '0.1', '0.1', '0.1', '10.5', '10.5', '< 00:01', '18.5']
+        with open(cad_file, 'w') as outfile:
+            json.dump({'data': [
+                row,
+                row[:5],
+                [None] + row[1:],
+                row[:4] + ['n/a'] + row[5:],
+                row[:3] + ['2020-Foo-01 00:00'] + row[4:],
+            ]}, outfile)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            approaches = load_approaches(cad_file)
+        self.assertEqual([approach.designation for approach in approaches], ['2101'])
+        self.assertIn('Skipped 4 malformed rows', output.getvalue())
+
+
+class TestLoadCache(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.neo_file = self.root / TEST_NEO_FILE.name
+        self.cad_file = self.root / TEST_CAD_FILE.name
+        shutil.copy(TEST_NEO_FILE, self.neo_file)
+        shutil.copy(TEST_CAD_FILE, self.cad_file)
+        os.chmod(self.neo_file, 0o644)
+
+    def test_load_does_not_cache_by_default(self):
+        load_neos(self.neo_file)
+        load_approaches(self.cad_file)
+        self.assertFalse(os.path.exists(f"{self.neo_file}{CACHE_SUFFIX}"))
+        self.assertFalse(os.path.exists(f"{self.cad_file}{CACHE_SUFFIX}"))
+
+    def test_load_writes_sidecar_cache(self):
+        load_neos(self.neo_file, use_cache=True)
+        load_approaches(self.cad_file, use_cache=True)
+        self.assertTrue(os.path.exists(f"{self.neo_file}{CACHE_SUFFIX}"))
+        self.assertTrue(os.path.exists(f"{self.cad_file}{CACHE_SUFFIX}"))
+
+    def test_cached_neos_match_parsed_neos(self):
+        parsed = load_neos(self.neo_file, use_cache=True)
+        cached = load_neos(self.neo_file, use_cache=True)
+        # Compare representations, since unknown diameters are NaN (and NaN != NaN).
+        self.assertEqual([repr(neo) for neo in parsed], [repr(neo) for neo in cached])
+
+    def test_cached_approaches_match_parsed_approaches(self):
+        parsed = load_approaches(self.cad_file, use_cache=True)
+        cached = load_approaches(self.cad_file, use_cache=True)
+        self.assertEqual([approach.serialize() for approach in parsed],
+                         [approach.serialize() for approach in cached])
+
+    def test_cache_is_invalidated_when_source_changes(self):
+        self.assertEqual(len(load_neos(self.neo_file, use_cache=True)), 4226)
+        with open(self.neo_file) as infile:
+            lines = infile.readlines()
+        with open(self.neo_file, 'w') as outfile:
+            outfile.writelines(lines[:11])
+        self.assertEqual(len(load_neos(self.neo_file, use_cache=True)), 10)
+
+    def test_cache_is_invalidated_when_parser_changes(self):
+        self.assertEqual(_cached_load(self.neo_file, lambda path: ['old'], True), ['old'])
+        self.assertEqual(_cached_load(self.neo_file, lambda path: ['new'], True), ['new'])
+
+    def test_cache_writable_by_others_is_ignored(self):
+        calls = []
+
+        def parser(path):
+            calls.append(path)
+            return ['parsed']
+
+        _cached_load(self.neo_file, parser, True)
+        _cached_load(self.neo_file, parser, True)
+        self.assertEqual(len(calls), 1)
+
+        os.chmod(f"{self.neo_file}{CACHE_SUFFIX}", 0o666)
+        _cached_load(self.neo_file, parser, True)
+        self.assertEqual(len(calls), 2)
+
+    def test_cache_referencing_missing_module_is_ignored(self):
+        calls = []
+
+        def parser(path):
+            calls.append(path)
+            return ['parsed']
+
+        _cached_load(self.neo_file, parser, True)
+        cache_path = f"{self.neo_file}{CACHE_SUFFIX}"
+        with open(cache_path, 'rb') as infile:
+            key = pickle.load(infile)
+        with open(cache_path, 'wb') as outfile:
+            pickle.dump(key, outfile)
+            outfile.write(b'cnonexist\nX\n.')
+
+        self.assertEqual(_cached_load(self.neo_file, parser, True), ['parsed'])
+        self.assertEqual(len(calls), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+"""Check that NASA-formatted calendar dates are converted to and from datetimes.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime, datetime_to_str
+
+
+class TestHelpers(unittest.TestCase):
+    def test_cd_to_datetime(self):
+        self.assertEqual(cd_to_datetime('2020-Dec-31 12:00'), datetime.datetime(2020, 12, 31, 12, 0))
+        self.assertEqual(cd_to_datetime('1900-Jan-01 00:11'), datetime.datetime(1900, 1, 1, 0, 11))
+
+    def test_cd_to_datetime_matches_strptime_for_every_month(self):
+        for month in range(1, 13):
+            dt = datetime.datetime(2020, month, 9, 7, 5)
+            calendar_date = dt.strftime('%Y-%b-%d %H:%M')
+            self.assertEqual(cd_to_datetime(calendar_date), dt)
+
+    def test_cd_to_datetime_accepts_unpadded_fields(self):
+        self.assertEqual(cd_to_datetime('2020-Mar-2 3:04'), datetime.datetime(2020, 3, 2, 3, 4))
+
+    def test_cd_to_datetime_rejects_malformed_dates(self):
+        with self.assertRaises(ValueError):
+            cd_to_datetime('2020-Foo-31 12:00')
+        with self.assertRaises(ValueError):
+            cd_to_datetime('2020-Feb-31 12:00')
+        for calendar_date in ('2020xJanx01x00x00', '+020-Jan-01 00:00', ' 202-Jan-01 00:00'):
+            with self.subTest(calendar_date=calendar_date), self.assertRaises(ValueError):
+                cd_to_datetime(calendar_date)
+
+    def test_datetime_to_str(self):
+        self.assertEqual(datetime_to_str(datetime.datetime(2020, 12, 31, 12, 0)), '2020-12-31 12:00')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -528,6 +528,27 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_generates_approaches_in_time_order(self):
+        filters = create_filters(start_date=datetime.date(2020, 3, 1), end_date=datetime.date(2020, 6, 30))
+        received = [approach.time for approach in self.db.query(filters)]
+        self.assertGreater(len(received), 0)
+        self.assertEqual(received, sorted(received))
+
+    def test_query_with_plain_callable_and_attribute_filters(self):
+        start_date = datetime.date(2020, 3, 1)
+
+        expected = set(
+            approach for approach in self.approaches
+            if start_date <= approach.time.date()
+            and approach.neo.name is not None
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = create_filters(start_date=start_date)
+        filters.append(lambda approach: approach.neo.name is not None)
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
 
 if __name__ == '__main__':
     unittest.main()
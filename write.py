@@ -12,7 +12,6 @@ You'll edit this file in Part 4.
 """
 import csv
 import json
-from helpers import datetime_to_str
 
 
 def write_to_csv(results, filename):
@@ -35,7 +34,7 @@ def write_to_csv(results, filename):
         writer.writeheader()
         for approach in results:
             row = {
-                'datetime_utc': datetime_to_str(approach.time),
+                'datetime_utc': approach.time_str,
                 'distance_au': approach.distance,
                 'velocity_km_s': approach.velocity,
                 'designation': approach.neo.designation,
@@ -60,7 +59,7 @@ def write_to_json(results, filename):
     data = []
     for approach in results:
         entry = {
-            'datetime_utc': datetime_to_str(approach.time),
+            'datetime_utc': approach.time_str,
             'distance_au': approach.distance,
             'velocity_km_s': approach.velocity,
             'neo': {